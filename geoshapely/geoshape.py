@@ -1,5 +1,10 @@
-from copy import deepcopy
-from typing import Any, Optional, TypeVar
+import struct
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
 
 import pyproj
 from shapely.geometry import (
@@ -11,7 +16,8 @@ from shapely.geometry import (
     Point,
     Polygon,
 )
-from shapely.ops import transform
+from shapely.geometry.base import BaseGeometry, deserialize_wkb
+from shapely.geos import lgeos
 
 SHAPELY_GEOMS = [
     Point,
@@ -26,6 +32,202 @@ SHAPELY_GEOMS = [
 
 GeoShapeType = TypeVar("GeoShapeType", bound="GeoBaseGeometry")
 
+# Set on the geometry type of extended WKB when the geometry has Z coordinates
+_WKB_Z_FLAG = 0x80000000
+# Little-endian WKB of a 2D point: byte order, geometry type, x, y
+_WKB_POINT = struct.Struct("<BIdd")
+
+
+# Transformers are cached per thread. PROJ objects are not shared between threads,
+# so pyproj already rebuilds a Transformer the first time each thread uses it.
+_TRANSFORMER_CACHE_SIZE = 16
+_transformer_cache = threading.local()
+
+
+def _cached_transformer(src_srs: str, dst_srs: str) -> pyproj.Transformer:
+    """Return a pyproj.Transformer between two CRSes, given by their `pyproj.CRS.srs`.
+
+    Building a Transformer is far more expensive than using one, so Transformers are
+    cached and reused across calls, up to `_TRANSFORMER_CACHE_SIZE` per thread with the
+    least recently used ones evicted first. `CRS.srs` holds the string a CRS was
+    created from, which fully determines the CRS, so unlike `CRS.to_wkt()` it makes a
+    cache key that costs nothing to get.
+    """
+    cache = getattr(_transformer_cache, "transformers", None)
+    if cache is None:
+        cache = _transformer_cache.transformers = OrderedDict()
+    key = (src_srs, dst_srs)
+    transformer = cache.get(key)
+    if transformer is None:
+        transformer = cache[key] = pyproj.Transformer.from_crs(src_srs, dst_srs)
+        if len(cache) > _TRANSFORMER_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return transformer
+
+
+@lru_cache(maxsize=256)
+def _crs_from_hashable(crs: Any) -> pyproj.CRS:
+    """Return a cached pyproj.CRS for a hashable CRS representation, e.g. str or int.
+
+    Saves re-parsing the same CRS string or EPSG code for every new GeoShape.
+    """
+    return pyproj.CRS.from_user_input(crs)
+
+
+# Parsers for the most common kinds of CRS input, looked up by exact type to skip
+# the isinstance checks in `_parse_crs`
+_CRS_PARSERS = {
+    type(None): lambda crs: None,
+    pyproj.CRS: lambda crs: crs,
+    str: _crs_from_hashable,
+    int: _crs_from_hashable,
+}
+
+
+def _parse_crs(crs: Optional[Any]) -> Optional[pyproj.CRS]:
+    """Parse and return a pyproj.CRS, or None, from any input.
+
+    If anything other than a GeoShape, pyproj.CRS, or None are passed in, the value
+    will be passed to `pyproj.CRS.from_user_input()`. That method is capable of
+    parsing a wide variety of CRS representations, including str and int types.
+    See pyproj docs for further details. Results are cached for hashable inputs, so
+    repeated values are only parsed once.
+
+    Parameters
+    ----------
+    crs:
+        An optional CRS representation. Can be a pyproj.CRS, any instance
+        of a GeoShape, any value parsable by pyproj.CRS.from_user_input,
+        or None.
+
+    Returns
+    -------
+    A pyproj.CRS or None
+    """
+    parser = _CRS_PARSERS.get(type(crs))
+    if parser is not None:
+        return parser(crs)
+    elif isinstance(crs, GeoBaseGeometry):
+        # Users can pass in a GeoShape
+        return crs.crs
+    elif isinstance(crs, pyproj.CRS):
+        return crs
+    else:
+        # Attempt to generate CRS from other input
+        try:
+            return _crs_from_hashable(crs)
+        except TypeError:
+            # Unhashable input, e.g. a dict of PROJ parameters
+            return pyproj.CRS.from_user_input(crs)
+
+
+def _crs_equal(crs: Optional[pyproj.CRS], other: Optional[pyproj.CRS]) -> bool:
+    """Return whether two parsed CRSes, or None, are equal.
+
+    Since parsed CRSes are cached, equal CRSes are often the very same object, or were
+    at least created from the same input. Those cases are checked first, as they are
+    much cheaper than PROJ's own comparison.
+    """
+    if crs is other:
+        return True
+    if crs is None or other is None:
+        return False
+    return crs.srs == other.srs or crs == other
+
+
+def _wkb_coord_spans(wkb: bytes) -> Tuple[int, List[slice]]:
+    """Locate the coordinates in the WKB of a Point, LineString, LinearRing or Polygon.
+
+    Returns the number of dimensions of the geometry, and the byte ranges which hold
+    its coordinates (one range per ring for polygons).
+    """
+    uint = struct.Struct("<I" if wkb[0] == 1 else ">I")
+    (geom_type,) = uint.unpack_from(wkb, 1)
+    ndim = 3 if geom_type & _WKB_Z_FLAG else 2
+    coord_size = 8 * ndim
+    geom_type &= 0xFF
+
+    if geom_type == 1:  # Point
+        return ndim, [slice(5, 5 + coord_size)]
+    if geom_type == 2:  # LineString, and LinearRing which WKB treats as one
+        (num_coords,) = uint.unpack_from(wkb, 5)
+        return ndim, [slice(9, 9 + num_coords * coord_size)]
+    if geom_type == 3:  # Polygon
+        (num_rings,) = uint.unpack_from(wkb, 5)
+        spans = []
+        offset = 9
+        for _ in range(num_rings):
+            (num_coords,) = uint.unpack_from(wkb, offset)
+            offset += 4
+            spans.append(slice(offset, offset + num_coords * coord_size))
+            offset = spans[-1].stop
+        return ndim, spans
+    raise TypeError(f"Cannot reproject WKB geometry of type {geom_type}")
+
+
+def _transform_wkb_coords(
+    wkbs: List[Tuple[bytearray, List[slice]]], ndim: int, transformer: pyproj.Transformer
+) -> None:
+    """Transform the coordinates held in the given spans of each WKB, in place.
+
+    The coordinates of every WKB are gathered into one array per dimension and handed
+    to pyproj in a single `transform` call. All WKBs must have `ndim` dimensions.
+    """
+    coords = array("d", b"".join(wkb[span] for wkb, spans in wkbs for span in spans))
+    # All WKB written by Shapely in this process shares the same byte order
+    swap_bytes = (wkbs[0][0][0] == 1) != (sys.byteorder == "little")
+    if swap_bytes:
+        coords.byteswap()
+
+    columns = [coords[dim::ndim] for dim in range(ndim)]
+    transformer.transform(*columns, inplace=True)
+    for dim, column in enumerate(columns):
+        coords[dim::ndim] = column
+
+    if swap_bytes:
+        coords.byteswap()
+    data = coords.tobytes()
+    start = 0
+    for wkb, spans in wkbs:
+        for span in spans:
+            end = start + span.stop - span.start
+            wkb[span] = data[start:end]
+            start = end
+
+
+def _reproject(
+    geoms: Sequence[GeoShapeType], transformer: pyproj.Transformer, crs: Optional[pyproj.CRS]
+) -> List[GeoShapeType]:
+    """Return new GeoShapes with the coordinates of `geoms` transformed by `transformer`.
+
+    Iterating over Shapely coordinates is slow since every coordinate is fetched from
+    GEOS individually. Instead, the coordinates are read straight out of the WKB of each
+    geometry, transformed with a single call to pyproj per number of dimensions, and
+    written back into the WKB that the new GeoShapes are loaded from.
+    """
+    wkbs = [None if geom.is_empty else bytearray(geom.wkb) for geom in geoms]
+    batches: Dict[int, List[Tuple[bytearray, List[slice]]]] = {}
+    for wkb in wkbs:
+        if wkb is not None:
+            ndim, spans = _wkb_coord_spans(wkb)
+            batches.setdefault(ndim, []).append((wkb, spans))
+    for ndim, batch in batches.items():
+        _transform_wkb_coords(batch, ndim, transformer)
+
+    results = []
+    for geom, wkb in zip(geoms, wkbs):
+        if wkb is None:
+            result = geom._clone()
+        else:
+            result = object.__new__(type(geom))
+            # Shapely's unpickling hook loads the WKB into the matching geometry type
+            result.__setstate__(bytes(wkb))
+        result._crs = crs
+        results.append(result)
+    return results
+
 
 class GeoBaseGeometry:
     """The base class for all GeoShape classes.
@@ -38,37 +240,28 @@ class GeoBaseGeometry:
     """
 
     def __init__(self, crs: Optional[Any]) -> None:
-        self._crs = self._parse_crs(crs)
-
-    def _parse_crs(self, crs: Optional[Any]) -> Optional[pyproj.CRS]:
-        """Parse and return a pyproj.CRS, or None, from any input.
+        self._crs = _parse_crs(crs)
 
-        If anything other than a GeoShape, pyproj.CRS, or None are passed in, the value
-        will be passed to `pyproj.CRS.from_user_input()`. That method is capable of
-        parsing a wide variety of CRS representations, including str and int types.
-        See pyproj docs for further details.
-
-        Parameters
-        ----------
-        crs:
-            An optional CRS representation. Can be a pyproj.CRS, any instance
-            of a GeoShape, any value parsable by pyproj.CRS.from_user_input,
-            or None.
+    @classmethod
+    def _from_geom(
+        cls: Type[GeoShapeType], geom: BaseGeometry, crs: Optional[pyproj.CRS]
+    ) -> GeoShapeType:
+        """Create a GeoShape from a copy of a Shapely geometry of the equivalent type.
 
-        Returns
-        -------
-        A pyproj.CRS or None
+        Skips the Shapely constructors entirely: the GEOS geometry is cloned directly,
+        which is much cheaper than re-creating it or round-tripping it through WKB as
+        `deepcopy` does. `crs` must have already been parsed.
         """
-        if crs is None:
-            return crs
-        elif isinstance(crs, GeoBaseGeometry):
-            # Users can pass in a GeoShape
-            return crs.crs
-        elif isinstance(crs, pyproj.CRS):
-            return crs
-        else:
-            # Attempt to generate CRS from other input
-            return pyproj.CRS.from_user_input(crs)
+        result = object.__new__(cls)
+        if not geom._is_empty:
+            result._set_geom(lgeos.GEOSGeom_clone(geom._geom))
+            result._ndim = geom._ndim
+        result._crs = crs
+        return result
+
+    def _clone(self: GeoShapeType) -> GeoShapeType:
+        """Return a copy of the GeoShape with the same geometry and CRS."""
+        return self._from_geom(self, self._crs)
 
     @property
     def crs(self) -> Optional[pyproj.CRS]:
@@ -114,20 +307,19 @@ class GeoBaseGeometry:
             If allow_override is False and the object already has a CRS different from
             the one passed into this function.
         """
-        crs = self._parse_crs(crs)
-        if self.crs is not None and not allow_override and self.crs != crs:
+        crs = _parse_crs(crs)
+        if self.crs is not None and not allow_override and not _crs_equal(self.crs, crs):
             raise ValueError(
                 "Geometry already has a CRS that does not match the passed CRS."
                 "Specify 'allow_override=True' to allow replacing the existing "
                 "CRS without doing any transformation. Use `.to_crs()` to transform the "
                 "geometry instead."
             )
-        if not inplace:
-            result = deepcopy(self)
-        else:
-            result = self
-        result._crs = crs
-        return result
+        if inplace:
+            self._crs = crs
+            return self
+        # Only the CRS differs, so the geometry is cloned straight into the new GeoShape
+        return self._from_geom(self, crs)
 
     def to_crs(
         self: GeoShapeType,
@@ -136,16 +328,17 @@ class GeoBaseGeometry:
     ) -> GeoShapeType:
         """Transfrom the GeoShape from one CRS to another.
 
-        Given a CRS value, the shape will be converted using Shapely's `transform`
-        operation in combination with pyproj's `Transformer` class.
+        Given a CRS value, the coordinates of the shape will be converted using
+        pyproj's `Transformer` class, in a single batch for the whole shape.
 
-        A new instance of the shape is returned, reprojected to the desired CRS.
+        A new instance of the shape is returned, reprojected to the desired CRS. If the
+        shape is already in the desired CRS, the new instance is a plain copy.
 
-        Note that by default, `to_crs()` creates a new pyproj.Transformer each time
-        it's called. This can be slow when mass-converting a large number of objects.
-        Users can create their own Transformer once and then pass it into this method
-        to optimize the process. Also consider using GeoPandas for bulk geometry and
-        conversion handling.
+        By default, `to_crs()` reuses a cached pyproj.Transformer for each pair of
+        source and target CRSes, so repeatedly converting between the same CRSes only
+        pays the cost of creating a Transformer once. A pre-created Transformer may
+        still be passed in explicitly. Also consider using GeoPandas for bulk geometry
+        and conversion handling.
 
         Parameters
         ----------
@@ -166,9 +359,10 @@ class GeoBaseGeometry:
         ------
         ValueError:
             If a transformer is passed in but its source/target CRS params do not match
-            the current or desired CRSes.
+            the current or desired CRSes, or if the desired CRS is None while the shape
+            has a CRS.
         """
-        crs = self._parse_crs(crs)
+        crs = _parse_crs(crs)
         if transformer:
             if transformer.source_crs != self.crs:
                 raise ValueError(
@@ -184,13 +378,17 @@ class GeoBaseGeometry:
                 )
         if self.crs is None:
             return self.set_crs(crs)
+        if crs is None:
+            raise ValueError(
+                "Cannot transform a geometry to a CRS of None. Use `.set_crs()` with "
+                "'allow_override=True' to remove the CRS instead."
+            )
+        if _crs_equal(self._crs, crs):
+            # Nothing to transform
+            return self._clone()
         if not transformer:
-            transformer = pyproj.Transformer.from_crs(self._crs, crs)
-        transform_func = transformer.transform
-        result = deepcopy(self)
-        result = transform(transform_func, result)
-        result._crs = crs
-        return result
+            transformer = _cached_transformer(self._crs.srs, crs.srs)
+        return _reproject([self], transformer, crs)[0]
 
 
 class GeoPoint(GeoBaseGeometry, Point):
@@ -198,6 +396,48 @@ class GeoPoint(GeoBaseGeometry, Point):
         GeoBaseGeometry.__init__(self, crs=crs)
         Point.__init__(self, *args, **kwargs)
 
+    @classmethod
+    def from_arrays(
+        cls, xs: Sequence[float], ys: Sequence[float], crs: Optional[Any] = None
+    ) -> List["GeoPoint"]:
+        """Create a list of GeoPoints from sequences of x and y coordinates.
+
+        Faster than creating each GeoPoint individually: the CRS is only parsed once,
+        and each point is loaded straight from WKB rather than through the Point
+        constructor.
+
+        Parameters
+        ----------
+        xs:
+            The x coordinates of the points.
+        ys:
+            The y coordinates of the points.
+        crs: (Optional)
+            A CRS to be associated with all of the new GeoPoints.
+
+        Returns
+        -------
+        A list of new GeoPoints, one per pair of coordinates.
+
+        Raises
+        ------
+        ValueError:
+            If `xs` and `ys` are not the same length.
+        """
+        if len(xs) != len(ys):
+            raise ValueError(
+                f"`xs` and `ys` must be the same length, got {len(xs)} and {len(ys)}."
+            )
+        crs = _parse_crs(crs)
+        points = []
+        for x, y in zip(xs, ys):
+            point = object.__new__(cls)
+            point._set_geom(deserialize_wkb(_WKB_POINT.pack(1, 1, x, y)))
+            point._ndim = 2
+            point._crs = crs
+            points.append(point)
+        return points
+
 
 class GeoPolygon(GeoBaseGeometry, Polygon):
     def __init__(self, *args, crs: Optional[Any] = None, **kwargs) -> None:
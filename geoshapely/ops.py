@@ -1,10 +1,31 @@
-from copy import deepcopy
-from typing import Any, Optional
+from array import array
+from ctypes import byref, c_double, c_uint
+from typing import Any, Iterable, List, Optional
 
 from shapely.geometry import LinearRing, LineString, Point, Polygon
 from shapely.geometry.base import BaseGeometry
+from shapely.geos import lgeos
 
-from .geoshape import GeoBaseGeometry, GeoLinearRing, GeoLineString, GeoPoint, GeoPolygon
+from .geoshape import (
+    GeoBaseGeometry,
+    GeoLinearRing,
+    GeoLineString,
+    GeoPoint,
+    GeoPolygon,
+    _cached_transformer,
+    _crs_equal,
+    _parse_crs,
+    _reproject,
+)
+
+# The GeoShape equivalent of each Shapely geometry class
+# TODO add multigeoms
+_GEOSHAPE_CLASSES = {
+    Point: GeoPoint,
+    LinearRing: GeoLinearRing,
+    LineString: GeoLineString,
+    Polygon: GeoPolygon,
+}
 
 
 def make_geoshape_from_geom(
@@ -39,29 +60,160 @@ def make_geoshape_from_geom(
         If `shapely_geom` is not derived from BaseGeometry or if no equivalent GeoShape
         can be identified.
     """
-    if not isinstance(shapely_geom, BaseGeometry):
+    geoshape_class = _GEOSHAPE_CLASSES.get(type(shapely_geom))
+    if geoshape_class is not None:
+        result = geoshape_class._from_geom(shapely_geom, _parse_crs(crs))
+    elif not isinstance(shapely_geom, BaseGeometry):
         raise TypeError(
             f"`shapely_geom` must be an instance of Shapely geometry \
             derived from `BaseGeometry`, cannot convert value of type {type(shapely_geom)}"
         )
-    if isinstance(shapely_geom, GeoBaseGeometry):
-        # Just create a copy if a GeoShape is passed it back
-        result = deepcopy(shapely_geom)
-        if result.crs:
-            result = result.to_crs(crs=crs)
+    elif isinstance(shapely_geom, GeoBaseGeometry):
+        # A copy is returned, converted to the new CRS if one was set
+        if crs is None:
+            result = shapely_geom._clone()
+        elif shapely_geom.crs:
+            result = shapely_geom.to_crs(crs=crs)
         else:
             result = shapely_geom.set_crs(crs)
-    elif type(shapely_geom) is Point:
-        result = GeoPoint(shapely_geom, crs=crs)
-    elif type(shapely_geom) is LinearRing:
-        result = GeoLinearRing(shapely_geom, crs=crs)
-    elif type(shapely_geom) is LineString:
-        result = GeoLineString(shapely_geom, crs=crs)
-    elif type(shapely_geom) is Polygon:
-        result = GeoPolygon(shapely_geom, crs=crs)
-    # TODO add multigeoms
     else:
         raise TypeError(
             f"No suitable Geo-equivalent exists for value of type {type(shapely_geom)}"
         )
     return result
+
+
+def reproject_many(
+    geoms: Iterable[BaseGeometry], crs: Any, src_crs: Optional[Any] = None
+) -> List[GeoBaseGeometry]:
+    """Transform many geometries from one CRS to another at once.
+
+    Equivalent to calling `.to_crs()` on each geometry, but faster for large numbers of
+    geometries as the coordinates of all of them are transformed together, with a
+    single pyproj call.
+
+    Parameters
+    ----------
+    geoms:
+        The geometries to transform. Can be GeoShapes, which must all share the same
+        CRS, or Shapely geometries supported by `make_geoshape_from_geom`. Geometries
+        without a CRS of their own are assumed to be in `src_crs`.
+    crs:
+        The CRS to transform the geometries to.
+        See `pyproj.CRS.from_user_input()` for information on allowable types.
+    src_crs: (Optional)
+        The CRS the geometries are in. Defaults to the CRS of the first GeoShape
+        in `geoms` that has one.
+
+    Returns
+    -------
+    A list of new GeoShapes, transformed to the new CRS, in the same order as `geoms`.
+
+    Raises
+    ------
+    ValueError:
+        If the target CRS is None, if no source CRS can be determined, or if the
+        GeoShapes do not all share the same CRS.
+    TypeError:
+        If any of `geoms` has no Geo-equivalent. See `make_geoshape_from_geom`.
+    """
+    geoms = list(geoms)
+    if not geoms:
+        return []
+    crs = _parse_crs(crs)
+    if crs is None:
+        raise ValueError(
+            "Cannot transform a geometry to a CRS of None. Use `.set_crs()` with "
+            "'allow_override=True' to remove the CRS instead."
+        )
+    if src_crs is None:
+        geo_crses = (geom.crs for geom in geoms if isinstance(geom, GeoBaseGeometry))
+        src_crs = next((geo_crs for geo_crs in geo_crses if geo_crs is not None), None)
+        if src_crs is None:
+            raise ValueError("No source CRS was passed and none of the geometries have one.")
+    else:
+        src_crs = _parse_crs(src_crs)
+
+    geoshapes = []
+    for geom in geoms:
+        if not isinstance(geom, GeoBaseGeometry):
+            geom = make_geoshape_from_geom(geom, src_crs)
+        elif geom.crs is None:
+            geom = geom.set_crs(src_crs)
+        elif not _crs_equal(geom.crs, src_crs):
+            raise ValueError(
+                f"All geometries must share the same CRS, expected {src_crs} but "
+                f"found a geometry with CRS {geom.crs}."
+            )
+        geoshapes.append(geom)
+    if _crs_equal(src_crs, crs):
+        # Nothing to transform
+        return [geom._clone() for geom in geoshapes]
+
+    transformer = _cached_transformer(src_crs.srs, crs.srs)
+    return _reproject(geoshapes, transformer, crs)
+
+
+def reproject_points(points: Iterable[GeoPoint], crs: Any) -> List[GeoPoint]:
+    """Transform many GeoPoints from one CRS to another at once.
+
+    A faster version of `reproject_many` for 2D GeoPoints that share a CRS. The x and y
+    coordinates of all points are read from GEOS into two arrays in a single pass,
+    transformed with a single pyproj call, and the new GeoPoints are created straight
+    from the results with `GeoPoint.from_arrays`.
+
+    Any other input, e.g. points with Z coordinates, empty points or points with
+    differing CRSes, is handed over to `reproject_many` instead.
+
+    Parameters
+    ----------
+    points:
+        The GeoPoints to transform.
+    crs:
+        The CRS to transform the points to.
+        See `pyproj.CRS.from_user_input()` for information on allowable types.
+
+    Returns
+    -------
+    A list of new GeoPoints, transformed to the new CRS, in the same order as `points`.
+
+    Raises
+    ------
+    ValueError, TypeError:
+        See `reproject_many`.
+    """
+    points = list(points)
+    if not points:
+        return []
+    src_crs = getattr(points[0], "crs", None)
+    if src_crs is None or any(
+        type(point) is not GeoPoint or point._ndim != 2 or not _crs_equal(point.crs, src_crs)
+        for point in points
+    ):
+        return reproject_many(points, crs)
+
+    crs = _parse_crs(crs)
+    if crs is None:
+        # Leave raising the error to `reproject_many`
+        return reproject_many(points, crs)
+    if _crs_equal(src_crs, crs):
+        # Nothing to transform
+        return [point._clone() for point in points]
+
+    # Read the coordinates straight from GEOS, skipping Shapely's coordinate sequences
+    xs = array("d", bytes(8 * len(points)))
+    ys = array("d", xs)
+    size, x, y = c_uint(), c_double(), c_double()
+    for i, point in enumerate(points):
+        coord_seq = lgeos.GEOSGeom_getCoordSeq(point._geom)
+        lgeos.GEOSCoordSeq_getSize(coord_seq, byref(size))
+        if size.value != 1:
+            # Empty point
+            return reproject_many(points, crs)
+        lgeos.GEOSCoordSeq_getX(coord_seq, 0, byref(x))
+        lgeos.GEOSCoordSeq_getY(coord_seq, 0, byref(y))
+        xs[i] = x.value
+        ys[i] = y.value
+
+    _cached_transformer(src_crs.srs, crs.srs).transform(xs, ys, inplace=True)
+    return GeoPoint.from_arrays(xs, ys, crs=crs)
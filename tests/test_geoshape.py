@@ -1,10 +1,21 @@
+import threading
+
 import pyproj
 import pytest
 from pyproj.exceptions import CRSError
 from shapely.geometry import Point, Polygon
 from shapely.geometry.base import BaseGeometry
+from shapely.ops import transform
 
-from geoshapely.geoshape import GeoBaseGeometry, GeoLinearRing, GeoLineString, GeoPoint, GeoPolygon
+from geoshapely.geoshape import (
+    _TRANSFORMER_CACHE_SIZE,
+    GeoBaseGeometry,
+    GeoLinearRing,
+    GeoLineString,
+    GeoPoint,
+    GeoPolygon,
+    _cached_transformer,
+)
 
 
 def test_geopoint():
@@ -35,6 +46,13 @@ def test_geopoint():
     # Test setting CRS by string
     test_geopoint = GeoPoint(test_coords, crs=test_crs_string)
     assert test_geopoint.crs == test_crs
+    # Parsed CRSes are reused between shapes
+    assert GeoPoint(test_coords, crs=test_crs_string).crs is test_geopoint.crs
+
+    # Test setting CRS by EPSG code and unhashable dict
+    assert GeoPoint(test_coords, crs=4326).crs == test_crs
+    test_geopoint = GeoPoint(test_coords, crs={"proj": "longlat", "datum": "WGS84"})
+    assert test_geopoint.crs.is_geographic
 
     #  Test `.set_crs`
     test_geopoint = GeoPoint(test_coords, crs=None)
@@ -47,6 +65,9 @@ def test_geopoint():
         set_geopoint.set_crs(alt_crs)
     set_geopoint.set_crs(alt_crs, inplace=True, allow_override=True)
     assert set_geopoint.crs == alt_crs
+    # Setting an equal CRS is allowed, however it was created
+    assert set_geopoint.set_crs("epsg:3857").crs == alt_crs
+    assert set_geopoint.set_crs(pyproj.CRS.from_epsg(3857)).crs == alt_crs
 
     # Test type checking
     with pytest.raises(CRSError):
@@ -61,6 +82,25 @@ def test_geopoint():
     assert isinstance(test_geopoint, BaseGeometry)
 
 
+def test_geopoint_from_arrays():
+    test_crs = pyproj.CRS.from_string("epsg:4326")
+    xs = [0, 1.5, -2]
+    ys = [3, -4, 5.25]
+
+    test_geopoints = GeoPoint.from_arrays(xs, ys, crs="epsg:4326")
+    assert len(test_geopoints) == len(xs)
+    for test_geopoint, x, y in zip(test_geopoints, xs, ys):
+        assert isinstance(test_geopoint, GeoPoint)
+        assert test_geopoint.coords[0] == (x, y)
+        assert not test_geopoint.has_z
+        assert test_geopoint.crs == test_crs
+
+    assert GeoPoint.from_arrays([], []) == []
+    assert GeoPoint.from_arrays(xs, ys)[0].crs is None
+    with pytest.raises(ValueError):
+        GeoPoint.from_arrays(xs, ys[:-1])
+
+
 def test_geolinestring():
     test_coords = [[0, 0], [1, 0], [1, 1]]
     test_crs_string = "epsg:4326"
@@ -88,3 +128,92 @@ def test_geolinearring():
     georing = GeoLinearRing(test_coords, crs=test_crs)
     assert georing.is_closed
     assert georing.length == 4.0
+
+
+def test_to_crs():
+    src_crs = pyproj.CRS.from_string("epsg:4326")
+    dst_crs = pyproj.CRS.from_string("epsg:3857")
+    transformer = pyproj.Transformer.from_crs(src_crs, dst_crs)
+    expected = transformer.transform(1, -1)
+
+    test_geopoint = GeoPoint(1, -1, crs=src_crs)
+    converted = test_geopoint.to_crs(dst_crs)
+    assert isinstance(converted, GeoPoint)
+    assert converted.crs == dst_crs
+    assert converted.coords[0] == pytest.approx(expected)
+    # Confirm the original was left untouched
+    assert test_geopoint.crs == src_crs
+    assert test_geopoint.coords[0] == (1, -1)
+
+    # Passing in a transformer gives the same result
+    converted = test_geopoint.to_crs(dst_crs, transformer=transformer)
+    assert converted.coords[0] == pytest.approx(expected)
+    with pytest.raises(ValueError):
+        test_geopoint.to_crs(src_crs, transformer=transformer)
+
+    # Every ring and dimension of a shape is converted
+    shell = ((0.0, 0.0, 1.0), (0.0, 1.0, 2.0), (1.0, 1.0, 3.0), (1.0, 0.0, 4.0))
+    hole = ((0.2, 0.2, 0.0), (0.2, 0.4, 0.0), (0.4, 0.4, 0.0))
+    test_geoshapes = [
+        GeoPolygon(shell, [hole], crs=src_crs),
+        GeoLineString(shell, crs=src_crs),
+        GeoLinearRing(shell, crs=src_crs),
+        GeoPoint(shell[0], crs=src_crs),
+    ]
+    for test_geoshape in test_geoshapes:
+        converted = test_geoshape.to_crs(dst_crs)
+        assert type(converted) is type(test_geoshape)
+        assert converted.geom_type == test_geoshape.geom_type
+        assert converted.has_z
+        assert converted.crs == dst_crs
+        assert converted.equals_exact(transform(transformer.transform, test_geoshape), 1e-6)
+
+    # Empty shapes are copied rather than modified
+    empty_geopoint = GeoPoint(crs=src_crs)
+    converted = empty_geopoint.to_crs(dst_crs)
+    assert converted.is_empty
+    assert converted.crs == dst_crs
+    assert empty_geopoint.crs == src_crs
+
+    # Converting to the same CRS returns a copy
+    converted = test_geopoint.to_crs("epsg:4326")
+    assert converted is not test_geopoint
+    assert converted.crs == src_crs
+    assert converted.coords[0] == (1, -1)
+
+    # A shape with a CRS cannot be converted to no CRS
+    with pytest.raises(ValueError):
+        test_geopoint.to_crs(None)
+
+    # Converting a shape without a CRS just sets it
+    converted = GeoPoint(1, -1).to_crs(dst_crs)
+    assert converted.crs == dst_crs
+    assert converted.coords[0] == (1, -1)
+
+    # Transformers are reused between calls
+    cached = _cached_transformer(src_crs.srs, dst_crs.srs)
+    assert GeoPoint(1, -1, crs="epsg:4326").to_crs(dst_crs).crs == dst_crs
+    assert _cached_transformer(src_crs.srs, dst_crs.srs) is cached
+
+
+def test_cached_transformer():
+    src_srs = "epsg:4326"
+    cached = _cached_transformer(src_srs, "epsg:3857")
+    assert _cached_transformer(src_srs, "epsg:3857") is cached
+
+    # Least recently used Transformers are evicted once the cache is full
+    dst_srses = [f"epsg:{32601 + i}" for i in range(_TRANSFORMER_CACHE_SIZE)]
+    for dst_srs in dst_srses:
+        _cached_transformer(src_srs, dst_srs)
+    assert _cached_transformer(src_srs, "epsg:3857") is not cached
+
+    # Each thread has its own cache
+    cached = _cached_transformer(src_srs, "epsg:3857")
+    thread_results = []
+    thread = threading.Thread(
+        target=lambda: thread_results.append(_cached_transformer(src_srs, "epsg:3857"))
+    )
+    thread.start()
+    thread.join()
+    assert thread_results[0] is not cached
+    assert _cached_transformer(src_srs, "epsg:3857") is cached
@@ -1,5 +1,6 @@
 import pyproj
 import pytest
+from shapely import wkt
 from shapely.geometry import LinearRing, LineString, Point, Polygon
 from shapely.geometry.base import BaseGeometry
 
@@ -49,4 +50,107 @@ def test_make_geoshape_from_geom():
         ops.make_geoshape_from_geom(weird_shape, crs)
 
     # Test that geoshapes can be passed in
-    ops.make_geoshape_from_geom(geopoint, crs)
+    copied = ops.make_geoshape_from_geom(geopoint, crs)
+    assert copied is not geopoint
+    assert copied.equals(geopoint)
+    assert copied.crs == crs
+
+    # GeoShapes are converted to the specified CRS
+    dst_crs = pyproj.CRS.from_string("epsg:3857")
+    converted = ops.make_geoshape_from_geom(geopoint, dst_crs)
+    assert isinstance(converted, GeoPoint)
+    assert converted.crs == dst_crs
+    assert converted.equals_exact(geopoint.to_crs(dst_crs), 1e-6)
+    assert geopoint.crs == crs
+
+    # Without a CRS, a plain copy is returned
+    copied = ops.make_geoshape_from_geom(geopoint)
+    assert copied is not geopoint
+    assert copied.equals(geopoint)
+    assert copied.crs == crs
+
+    # GeoShapes without a CRS get the specified one
+    copied = ops.make_geoshape_from_geom(GeoPoint(1, 1), crs)
+    assert copied.crs == crs
+
+
+def test_reproject_many():
+    src_crs = pyproj.CRS.from_string("epsg:4326")
+    dst_crs = pyproj.CRS.from_string("epsg:3857")
+
+    geoms = [
+        GeoPoint(1, 1, crs=src_crs),
+        GeoPoint(1, 1, 1, crs=src_crs),
+        GeoPolygon(((0.0, 0.0), (0.0, 1.0), (1.0, 1.0), (1.0, 0.0)), crs=src_crs),
+        GeoPoint(crs=src_crs),
+        LineString([[0, 0], [1, 0], [1, 1]]),
+    ]
+    converted = ops.reproject_many(geoms, dst_crs)
+    assert len(converted) == len(geoms)
+    for geom, result in zip(geoms, converted):
+        expected = ops.make_geoshape_from_geom(geom, src_crs).to_crs(dst_crs)
+        assert type(result) is type(expected)
+        assert result.crs == dst_crs
+        assert result.equals_exact(expected, 1e-6)
+        assert result.has_z == geom.has_z
+
+    # The source CRS can be given explicitly for geometries without one
+    converted = ops.reproject_many([Point(1, 1)], dst_crs, src_crs=src_crs)
+    assert converted[0].equals_exact(GeoPoint(1, 1, crs=src_crs).to_crs(dst_crs), 1e-6)
+
+    assert ops.reproject_many([], dst_crs, src_crs=src_crs) == []
+    assert ops.reproject_many([], dst_crs) == []
+    converted = ops.reproject_many(geoms[:1], src_crs)
+    assert converted[0] is not geoms[0]
+    assert converted[0].equals(geoms[0])
+    assert converted[0].crs == src_crs
+    with pytest.raises(ValueError):
+        ops.reproject_many([Point(1, 1)], dst_crs)
+    with pytest.raises(ValueError):
+        ops.reproject_many([GeoPoint(1, 1, crs=src_crs)], None)
+    with pytest.raises(ValueError):
+        ops.reproject_many([GeoPoint(1, 1, crs=src_crs), GeoPoint(1, 1, crs=dst_crs)], dst_crs)
+
+
+def test_reproject_points():
+    src_crs = pyproj.CRS.from_string("epsg:4326")
+    dst_crs = pyproj.CRS.from_string("epsg:3857")
+
+    points = GeoPoint.from_arrays([0, 1, -2.5], [10, 20, 30], crs=src_crs)
+    converted = ops.reproject_points(points, dst_crs)
+    assert len(converted) == len(points)
+    for point, result in zip(points, converted):
+        assert isinstance(result, GeoPoint)
+        assert result.crs == dst_crs
+        assert result.equals_exact(point.to_crs(dst_crs), 1e-6)
+
+    converted = ops.reproject_points(points, src_crs)
+    assert converted[0] is not points[0]
+    assert converted[0].equals(points[0])
+
+    # Other points are handled by `reproject_many`
+    points = [
+        GeoPoint(1, 1, 1, crs=src_crs),
+        GeoPoint(crs=src_crs),
+        ops.make_geoshape_from_geom(wkt.loads("POINT EMPTY"), src_crs),
+        GeoPoint(1, 1),
+    ]
+    converted = ops.reproject_points(points, dst_crs)
+    for point, result in zip(points, converted):
+        assert result.crs == dst_crs
+        assert result.has_z == point.has_z
+        assert result.is_empty == point.is_empty
+    assert converted[0].equals_exact(points[0].to_crs(dst_crs), 1e-6)
+
+    # Including plain Shapely points, even when they come first
+    converted = ops.reproject_points([Point(1, 1), GeoPoint(2, 2, crs=src_crs)], dst_crs)
+    assert isinstance(converted[0], GeoPoint)
+    assert converted[0].crs == dst_crs
+    assert converted[0].equals_exact(GeoPoint(1, 1, crs=src_crs).to_crs(dst_crs), 1e-6)
+    assert converted[1].equals_exact(GeoPoint(2, 2, crs=src_crs).to_crs(dst_crs), 1e-6)
+
+    assert ops.reproject_points([], dst_crs) == []
+    with pytest.raises(ValueError):
+        ops.reproject_points([GeoPoint(1, 1, crs=src_crs)], None)
+    with pytest.raises(ValueError):
+        ops.reproject_points([GeoPoint(1, 1, crs=src_crs), GeoPoint(1, 1, crs=dst_crs)], dst_crs)